@@ -5,42 +5,93 @@
 # • Heart-beat file updated only when loops succeed — Docker health-check
 #   restarts container if loops hang
 
-import os, re, random, asyncio, time, sys, socket, ssl, inspect, logging, pathlib, datetime
-from datetime import UTC
+import os, re, random, asyncio, time, sys, socket, ssl, logging, pathlib, queue, atexit, functools
 from dotenv import load_dotenv
-import logging
-from collections import deque
+from logging.handlers import QueueHandler, QueueListener
+from collections import deque, OrderedDict
+from dataclasses import dataclass, field
 
 import discord
-from discord import HTTPException, Embed
-from discord.ext import commands, tasks
-from discord.http import HTTPClient, Route
-from discord.utils import MISSING
+from discord import HTTPException
+from discord.ext import commands
+from discord.http import HTTPClient
 from curl_cffi.curl import CurlError
 import aiohttp
 
-log = logging.getLogger("ttforwarder")
 load_dotenv()
 
 # ── HEART-BEAT (for Docker health-check) ──────────────────────────────────
 HB_PATH = pathlib.Path("/tmp/ttforwarder_heartbeat")
+HB_MIN_INTERVAL = 30          # seconds; the health-check only needs minute resolution
+_last_hb = float("-inf")
+_hb_created = False
 
-def update_hb() -> None:
-    """Touch heartbeat file with current UTC timestamp."""
+def _write_hb() -> None:
+    # health-check only reads the mtime: write the file once, then just bump it
+    global _hb_created
     try:
-        HB_PATH.write_text(datetime.datetime.now(UTC).isoformat())
+        if _hb_created:
+            os.utime(HB_PATH, None)
+        else:
+            HB_PATH.write_text(str(int(time.time())))
+            _hb_created = True
     except Exception:
-        pass  # container continues even if /tmp is temporarily read-only
+        _hb_created = False   # recreate it next time if it went missing
+        # container continues even if /tmp is temporarily read-only
+
+def update_hb() -> None:
+    """Touch heartbeat file (its mtime is what the health-check reads).
+
+    Writes at most every HB_MIN_INTERVAL seconds and, when called from the event
+    loop, in the default executor so the file I/O never blocks the bots."""
+    global _last_hb
+    now = time.monotonic()
+    if now - _last_hb < HB_MIN_INTERVAL:
+        return
+    _last_hb = now
+    try:
+        asyncio.get_running_loop().run_in_executor(None, _write_hb)
+    except RuntimeError:          # no running loop
+        _write_hb()
 
 # ── LOGGING ───────────────────────────────────────────────────────────────
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
 LOG_FILE  = os.getenv("LOG_FILE", "ttforwarder.log")
 
+class BufferedFileHandler(logging.FileHandler):
+    """FileHandler that lets the file buffer batch records and only flushes
+    on WARNING and above (and on close)."""
+    def emit(self, record):
+        if self.stream is None:
+            self.stream = self._open()
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= logging.WARNING:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+# handlers run on the listener thread so disk/stdout writes never block the loop
+_log_q = queue.SimpleQueue()
+_log_listener = QueueListener(_log_q,
+                              BufferedFileHandler(LOG_FILE, encoding="utf-8"),
+                              logging.StreamHandler(sys.stdout),
+                              respect_handler_level=True)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+def _hard_exit(code: int = 1):
+    """os._exit() skips atexit: drain the log queue and flush the file first."""
+    _log_listener.stop()
+    logging.shutdown()
+    os._exit(code)
+
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s [%(levelname)s] %(message)s",
-    handlers=[logging.FileHandler(LOG_FILE, encoding="utf-8"),
-              logging.StreamHandler(sys.stdout)],
+    handlers=[QueueHandler(_log_q)],
 )
 log = logging.getLogger("ttforwarder")
 log.setLevel(getattr(logging, LOG_LEVEL, logging.INFO))
@@ -61,6 +112,10 @@ CALL_CH_ID = int(os.getenv("CALL_CH_ID"))
 BURP_CH_ID = int(os.getenv("BURP_CH_ID"))
 GL_CH_ID   = int(os.getenv("GL_CH_ID"))
 
+# the only channels any handler reacts to; everything else returns at once
+_INTERESTING_IDS = frozenset({TT_CH_ID, BURP_CH_ID, CMD_CH})
+_EMBED_IDS       = frozenset({BURP_CH_ID, CMD_CH})      # Rick's burp / tt results
+
 # These are kept for backward compatibility but no longer used directly
 INTERVAL_SECONDS = int(os.getenv("MONITOR_INTERVAL", "60"))
 BURP_INTERVAL    = int(os.getenv("BURP_INTERVAL", "60"))
@@ -70,53 +125,106 @@ COMMAND_DELAY    = int(os.getenv("COMMAND_DELAY", "30"))  # Increased from 15 to
 COPY_DELAY_MIN   = int(os.getenv("COPY_DELAY_MIN", "5"))  # Increased from 3 to 5
 COPY_DELAY_MAX   = int(os.getenv("COPY_DELAY_MAX", "15")) # Increased from 5 to 15
 BURP_COOLDOWN    = int(os.getenv("BURP_COOLDOWN", "600"))
+TWEET_DELAY      = (10, 35)  # seconds of jitter before each forwarded tweet
+BURP_DELAY       = (1, 15)   # seconds of jitter before each forwarded burp token
+MSG_CHUNK        = 1900      # max chars per batched forward (Discord caps messages at 2000)
 TEST_MODE        = os.getenv("TEST_MODE", "false").lower() == "true"  # Convert string to boolean
 
 FAIL_THRESHOLD   = 3   # after N consecutive REST failures → os._exit(1)
+RETRY_TICK       = 1   # seconds before a loop retries a firing that did not go through
+HTTP_ERR_WINDOW  = 30  # rebuild the HTTP client only on 2 REST errors within this many seconds
+
+# Upper bounds for the de-duplication caches (oldest entries are evicted first)
+TT_EMBED_CACHE   = int(os.getenv("TT_EMBED_CACHE", "10000"))
+TWEET_CACHE      = int(os.getenv("TWEET_CACHE", "50000"))
+BURP_TOKEN_CACHE = int(os.getenv("BURP_TOKEN_CACHE", "10000"))
 
 # ── STATE ────────────────────────────────────────────────────────────────
-isMonitoringTT   = True
-isMonitoringBurp = True
-processed_tt_embeds, processed_tweets = set(), set()
-burp_cycle_processed = set()
-last_trending_time, last_burp_time = 0.0, 0.0
+class LRUSet:
+    """Set-like container that keeps at most `cap` keys, evicting the oldest."""
+    __slots__ = ("_d", "_cap")
+
+    def __init__(self, cap: int):
+        self._d   = OrderedDict()
+        self._cap = cap
+
+    def __contains__(self, key) -> bool:
+        return key in self._d
+
+    def __len__(self) -> int:
+        return len(self._d)
+
+    def add(self, key) -> None:
+        self._d[key] = None
+        self._d.move_to_end(key)
+        if len(self._d) > self._cap:
+            self._d.popitem(last=False)
+
+    def update(self, keys) -> None:
+        for key in keys:
+            self.add(key)
+
+@dataclass(slots=True)
+class Config:
+    """Runtime-tunable settings; changed in place by the tt/burp control commands."""
+    copy_min:      int
+    copy_max:      int
+    command_delay: int
+    burp_cooldown: int
+    tt_on:         bool = True
+    burp_on:       bool = True
+
+CONFIG = Config(
+    copy_min=COPY_DELAY_MIN,
+    copy_max=COPY_DELAY_MAX,
+    command_delay=COMMAND_DELAY,
+    burp_cooldown=BURP_COOLDOWN,
+)
+# tweet URLs and burp tokens are stored as hash() ints rather than the strings
+processed_tt_embeds  = LRUSet(TT_EMBED_CACHE)     # message ids
+processed_tweets     = LRUSet(TWEET_CACHE)        # hash(url)
+burp_cycle_processed = LRUSet(BURP_TOKEN_CACHE)   # hash(token)
+# loop.time() of the last /tt and /burp firing (monotonic; -inf = never)
+last_trending_time, last_burp_time = float("-inf"), float("-inf")
 
 # ── STATE PERSISTENCE FUNCTIONS ───────────────────────────────────────────
 def save_state():
     """Save the current monitoring state to server_state.txt"""
     try:
         with open("server_state.txt", "w") as f:
-            f.write(f"isMonitoringTT={isMonitoringTT}\n")
-            f.write(f"isMonitoringBurp={isMonitoringBurp}\n")
+            f.write(f"isMonitoringTT={CONFIG.tt_on}\n")
+            f.write(f"isMonitoringBurp={CONFIG.burp_on}\n")
         log.info("Server state saved to server_state.txt")
     except Exception as e:
-        log.error(f"Failed to save server state: {e}")
+        log.error("Failed to save server state: %s", e)
 
 def load_state():
     """Load the monitoring state from server_state.txt if it exists"""
-    global isMonitoringTT, isMonitoringBurp
     try:
         if os.path.exists("server_state.txt"):
             with open("server_state.txt", "r") as f:
                 for line in f:
                     if line.startswith("isMonitoringTT="):
-                        isMonitoringTT = line.strip().split("=")[1].lower() == "true"
+                        CONFIG.tt_on = line.strip().split("=")[1].lower() == "true"
                     elif line.startswith("isMonitoringBurp="):
-                        isMonitoringBurp = line.strip().split("=")[1].lower() == "true"
-            log.info(f"Server state loaded: TT={isMonitoringTT}, Burp={isMonitoringBurp}")
+                        CONFIG.burp_on = line.strip().split("=")[1].lower() == "true"
+            log.info("Server state loaded: TT=%s, Burp=%s", CONFIG.tt_on, CONFIG.burp_on)
         else:
             log.info("No server_state.txt found, using default state")
     except Exception as e:
-        log.error(f"Failed to load server state: {e}")
+        log.error("Failed to load server state: %s", e)
 
-# Dictionary to store bot instances by label
-bot_instances = {}
+@dataclass(slots=True)
+class BotRegistry:
+    """Which bots are up and which of them currently holds each role."""
+    bot_instances:    dict = field(default_factory=dict)   # label -> bot
+    active_bots:      set  = field(default_factory=set)    # labels of ready bots
+    tt_command_bot:   str | None = None   # Bot that sends /tt commands
+    tt_scanner_bot:   str | None = None   # Bot that scans and forwards tweets
+    burp_command_bot: str | None = None   # Bot that sends /burp commands
+    burp_scanner_bot: str | None = None   # Bot that scans and forwards burp tokens
 
-# Role rotation tracking
-tt_command_bot = None  # Bot that sends /tt commands
-tt_scanner_bot = None  # Bot that scans and forwards tweets
-burp_command_bot = None  # Bot that sends /burp commands
-burp_scanner_bot = None  # Bot that scans and forwards burp tokens
+REG = BotRegistry()
 
 # Lists of available bots for each role
 tt_command_candidates = ["TRIBEIQ", "EYESINTHEHOOK"]  # Bots that can send /tt
@@ -124,10 +232,16 @@ tt_scanner_candidates = ["HOODNARRATOR", "READYTOSPY"]  # Bots that can scan twe
 burp_command_candidates = ["TRIBEIQ", "EYESINTHEHOOK"]  # Bots that can send /burp
 burp_scanner_candidates = ["HOODNARRATOR", "READYTOSPY"]  # Bots that can scan burp tokens
 
-# Track all active bots
-active_bots = set()
+# Rotation order: candidate -> the one after it (wrapping)
+def _successors(candidates: list) -> dict:
+    return {c: candidates[(i + 1) % len(candidates)] for i, c in enumerate(candidates)}
 
-ALLOWED_AUTHORS = {
+_TT_CMD_NEXT   = _successors(tt_command_candidates)
+_TT_SCAN_NEXT  = _successors(tt_scanner_candidates)
+_BURP_CMD_NEXT = _successors(burp_command_candidates)
+_BURP_SCAN_NEXT = _successors(burp_scanner_candidates)
+
+ALLOWED_AUTHORS = frozenset({
     219212900743512065, # Simple
     303754867044777985, # Dej
     979973170251567136, # Kit
@@ -135,24 +249,119 @@ ALLOWED_AUTHORS = {
     402836835627302922,
     290597129016311809,
     358568364375015424,
-}
+})
 
+# most frequent first: `except` tests the entries left to right
 NET_ERR = (
-    discord.InvalidData, HTTPException, CurlError,
-    aiohttp.ClientError, OSError, socket.gaierror, ssl.SSLError,
+    aiohttp.ClientError, CurlError, HTTPException,
+    OSError, ssl.SSLError, socket.gaierror, discord.InvalidData,
 )
 
 TW_URL_RE = re.compile(r"(https?://twitter\.com/[^\s\)\]]+)")
-TOKEN_RE  = re.compile(r"(0x[a-fA-F0-9]{40}|[A-Za-z0-9]+)$")
+# token = last alphanumeric run of a URL, ignoring any trailing "/", ")" etc.
+TAIL_TOKEN_RE = re.compile(r"(0x[a-fA-F0-9]{40}|[A-Za-z0-9]+)(?=[^A-Za-z0-9x]*$)", re.ASCII)
+# burp embed line → (Δ percentage, first URL), in whichever order they appear
+BURP_LINE_RE = re.compile(r"^(?=[^\n]*?Δ[^\S\n]*([-.\d]+)%)(?=[^\n]*?(https?://\S+))[^\n]*", re.M)
+
+_HEX  = frozenset("0123456789abcdefABCDEF")
+_WORD = frozenset("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_")
+
+def has_eth_addr(s: str) -> bool:
+    """True if `s` holds a standalone 0x + 40 hex-digit address, i.e. what
+    r"\b0x[a-fA-F0-9]{40}\b" (ASCII) matches, without the regex engine."""
+    i = s.find("0x")
+    while i != -1:
+        h = s[i + 2:i + 42]
+        if (len(h) == 40 and _HEX.issuperset(h)
+                and (i == 0 or s[i - 1] not in _WORD)
+                and s[i + 42:i + 43] not in _WORD):
+            return True
+        i = s.find("0x", i + 1)
+    return False
+
+def tail_token(url: str) -> str | None:
+    """Last alphanumeric run of `url` (TAIL_TOKEN_RE's match). The usual
+    ".../<token>" URL is answered with one rpartition; only URLs with a
+    trailing "/", ")" etc. go through the regex."""
+    tok = url.rpartition("/")[2]
+    if tok.isalnum() and tok.isascii():
+        return tok
+    m = TAIL_TOKEN_RE.search(url)
+    return m.group(1) if m else None
+
+# ── SHARED HTTP TRANSPORT ─────────────────────────────────────────────────
+# One TLS context and one connection pool / DNS cache for all four bots
+SSL_CTX = ssl.create_default_context()
+_connector = None
+
+class _SharedConnector(aiohttp.TCPConnector):
+    """A ClientSession closes the connector it was handed, and every bot's
+    close() / HTTP rebuild closes its session; with one connector for all four
+    bots that would cut the others' REST and gateway sockets. This one ignores
+    close() and lives as long as the process."""
+
+    async def close(self, *args, **kwargs):
+        return None
+
+def shared_connector() -> aiohttp.TCPConnector:
+    """The process-wide connector; built lazily (it needs the running loop)."""
+    global _connector
+    if _connector is None:
+        _connector = _SharedConnector(
+            limit=100, limit_per_host=30, ttl_dns_cache=300, use_dns_cache=True,
+            keepalive_timeout=75, family=socket.AF_INET, ssl=SSL_CTX,
+        )
+    return _connector
+
+PERMANENT_HTTP = frozenset({401, 403, 404})   # retrying these can't succeed
+
+def _is_permanent(e: BaseException) -> bool:
+    return isinstance(e, HTTPException) and e.status in PERMANENT_HTTP
+
+_BACKOFF_STEPS = (1, 2, 4, 8, 16, 30)         # min(2 ** retries, 30)
+
+def _backoff(retries: int) -> float:
+    """Exponential backoff capped at 30 s, with up to +50 % jitter so bots that
+    failed together don't retry in lockstep."""
+    return _BACKOFF_STEPS[min(retries, len(_BACKOFF_STEPS) - 1)] * (1 + random.random() * 0.5)
+
+def _retry_after(e: BaseException) -> float | None:
+    """Wait Discord asked for when `e` is a rate limit (429), else None."""
+    if not (isinstance(e, HTTPException) and e.status == 429):
+        return None
+    try:
+        return float(e.response.headers["Retry-After"])
+    except (AttributeError, KeyError, TypeError, ValueError):
+        return None
+
+class CircuitBreaker:
+    """Failure log shared by the four runners: the backoff doubles with every
+    failure any bot had in the last `window` seconds, so a Discord-wide outage
+    doesn't have all of them reconnecting every few seconds."""
+    __slots__ = ("_fails", "_window")
+
+    def __init__(self, window: float = 60, maxlen: int = 20):
+        self._fails = deque(maxlen=maxlen)
+        self._window = window
+
+    def record(self) -> None:
+        self._fails.append(time.monotonic())
+
+    def backoff(self, base: float = 5, cap: float = 300) -> float:
+        cutoff = time.monotonic() - self._window
+        n = sum(1 for t in self._fails if t > cutoff)
+        return min(base * 2 ** max(n - 1, 0), cap) * (1 + random.random() * 0.5)
+
+RUNNER_CB = CircuitBreaker()
+
+# command name -> [cooldown s, last call (monotonic)], enforced by the consumer
+_CMD_COOLDOWNS = {"tt": [180, float("-inf")], "burp": [600, float("-inf")]}
 
 # Command queue for producer-consumer pattern
 command_queue = asyncio.Queue()
 
 async def _command_consumer():
     """Single consumer that processes commands from the queue and enforces tt/burp cooldowns."""
-    last_tt_call   = 0.0
-    last_burp_call = 0.0
-
     while True:
         # small pause so we don't busy-spin
         await asyncio.sleep(0.5)
@@ -160,43 +369,30 @@ async def _command_consumer():
         # ——— Pre-filter pass: only keep *one* allowed /tt and one /burp ———
         buffer     = deque()
         now        = time.monotonic()
-        seen_tt    = False
-        seen_burp  = False
+        seen       = set()
 
         # drain everything
         while True:
             try:
-                cmd0, ch0, g0, mr0, bot0, fut0 = command_queue.get_nowait()
+                item = command_queue.get_nowait()
             except asyncio.QueueEmpty:
                 break
 
-            name0 = getattr(cmd0, "name", "").lower()
-            if name0 == "tt":
-                # allow only the very first tt if cooldown passed
-                if not seen_tt and (now - last_tt_call) >= 180:
-                    buffer.append((cmd0, ch0, g0, mr0, bot0, fut0))
-                    seen_tt = True
-                else:
-                    # drop all others immediately
-                    log.debug("[PRE-CONSUMER] Dropping extra /tt (cooldown or duplicate)")
-                    fut0.set_result(None)
-                command_queue.task_done()
-
-            elif name0 == "burp":
-                # allow only the very first burp if cooldown passed
-                if not seen_burp and (now - last_burp_call) >= 600:
-                    buffer.append((cmd0, ch0, g0, mr0, bot0, fut0))
-                    seen_burp = True
-                else:
-                    # drop extras
-                    log.debug("[PRE-CONSUMER] Dropping extra /burp (cooldown or duplicate)")
-                    fut0.set_result(None)
-                command_queue.task_done()
-
-            else:
+            name0 = item[0].name
+            entry = _CMD_COOLDOWNS.get(name0)
+            if entry is None:
                 # non-tt/burp commands just pass straight through
-                buffer.append((cmd0, ch0, g0, mr0, bot0, fut0))
-                command_queue.task_done()
+                buffer.append(item)
+            elif name0 not in seen and now - entry[1] >= entry[0]:
+                # allow only the very first one if its cooldown passed
+                buffer.append(item)
+                seen.add(name0)
+            else:
+                # drop all others immediately
+                if log.isEnabledFor(logging.DEBUG):
+                    log.debug("[PRE-CONSUMER] Dropping extra /%s (cooldown or duplicate)", name0)
+                item[5].set_result(None)
+            command_queue.task_done()
 
         # re-queue exactly the survivors (at most one /tt and one /burp)
         for item in buffer:
@@ -207,23 +403,17 @@ async def _command_consumer():
         cmd, channel, guild, max_retries, client_bot, future = cmd_tuple
 
         try:
-            cmd_name     = getattr(cmd, "name", "").lower()
+            cmd_name     = cmd.name
             current_time = time.monotonic()
 
             # final safety net cooldown
-            if cmd_name == "tt":
-                if current_time - last_tt_call < 180:
-                    log.warning("[COMMAND_CALL] (post-filter) Discarding tt—too soon")
-                    future.set_result(None)
-                    continue
-                last_tt_call = current_time
-
-            elif cmd_name == "burp":
-                if current_time - last_burp_call < 600:
-                    log.warning("[COMMAND_CALL] (post-filter) Discarding burp—too soon")
+            entry = _CMD_COOLDOWNS.get(cmd_name)
+            if entry is not None:
+                if current_time - entry[1] < entry[0]:
+                    log.warning("[COMMAND_CALL] (post-filter) Discarding %s—too soon", cmd_name)
                     future.set_result(None)
                     continue
-                last_burp_call = current_time
+                entry[1] = current_time
 
             # ——— TEST_MODE handling ———
             if TEST_MODE:
@@ -237,13 +427,13 @@ async def _command_consumer():
                     continue
 
                 if cmd_name == "tt":
-                    await bot.get_channel(TT_CH_ID).send("tt test")
+                    await _channel(bot, TT_CH_ID).send("tt test")
                     log.info("[COMMAND_CALL] Test mode: Sent 'tt test'")
                     future.set_result({"test_mode": True, "command": "tt"})
                     continue
 
                 if cmd_name == "burp":
-                    await bot.get_channel(BURP_CH_ID).send("burp test")
+                    await _channel(bot, BURP_CH_ID).send("burp test")
                     log.info("[COMMAND_CALL] Test mode: Sent 'burp test'")
                     future.set_result({"test_mode": True, "command": "burp"})
                     continue
@@ -253,17 +443,23 @@ async def _command_consumer():
             # ——— Normal execution with retry/backoff ———
             retries    = 0
             last_error = None
+            call       = functools.partial(cmd.__call__, channel=channel, guild=guild)
             while retries < max_retries:
                 try:
-                    result = await cmd.__call__(channel=channel, guild=guild)
+                    result = await call()
                     future.set_result(result)
                     break
                 except NET_ERR as e:
                     last_error = e
+                    if _is_permanent(e):
+                        log.error("[COMMAND_CALL] %r is not retryable", e)
+                        future.set_exception(e)
+                        break
                     retries   += 1
-                    backoff    = min(2 ** retries, 60)
+                    delay      = _retry_after(e)        # honour 429s, else back off
+                    backoff    = delay if delay is not None else _backoff(retries)
                     log.warning(
-                        "[COMMAND_CALL] %r, retrying in %s s (%s/%s)",
+                        "[COMMAND_CALL] %r, retrying in %.1f s (%s/%s)",
                         e, backoff, retries, max_retries
                     )
                     await asyncio.sleep(backoff)
@@ -290,17 +486,29 @@ async def safe_command_call(cmd, channel, guild, max_retries=3, client_bot=None)
     # Wait for the result
     return await future
 
-async def safe_fetch_commands(ch, max_retries=5):
+async def safe_fetch_commands(ch, max_retries=5, max_empty=6):
     retries = 0
+    empty, empty_delay = 0, 0.25
     while retries < max_retries:
         try:
             return await ch.application_commands()
         except ValueError:
-            await asyncio.sleep(1)
-        except NET_ERR:
+            # no command bucket yet: back off (0.25 s doubling to 15 s, jittered
+            # so the bots don't retry in lockstep) instead of polling forever
+            empty += 1
+            if empty >= max_empty:
+                log.error("[FETCH_COMMANDS] No commands after %s attempts", max_empty)
+                return []
+            await asyncio.sleep(empty_delay * (1 + random.random() * 0.5))
+            empty_delay = min(empty_delay * 2, 15.0)
+        except NET_ERR as e:
+            if _is_permanent(e):
+                log.error("[FETCH_COMMANDS] %r is not retryable", e)
+                return []
             retries += 1
-            backoff = min(2 ** retries, 60)  # Exponential backoff, max 60 seconds
-            log.warning("[FETCH_COMMANDS] Network error, retrying in %s seconds (%s/%s)", 
+            delay = _retry_after(e)          # honour 429s, else back off
+            backoff = delay if delay is not None else _backoff(retries)
+            log.warning("[FETCH_COMMANDS] Network error, retrying in %.1f seconds (%s/%s)", 
                        backoff, retries, max_retries)
             await asyncio.sleep(backoff)
 
@@ -308,209 +516,376 @@ async def safe_fetch_commands(ch, max_retries=5):
     log.error("[FETCH_COMMANDS] Failed after %s retries", max_retries)
     return []  # Return empty list as fallback
 
+# (bot label, channel id, name) -> (fetched at, command); commands are bound to
+# the client that fetched them, so entries are never shared between bots
+_cmd_cache: dict[tuple[str, int, str], tuple[float, object]] = {}
+
+async def cached_command(bot, ch, name, ttl=600):
+    """The `name` application command of `ch`, reused for `ttl` seconds."""
+    key = (bot.label, ch.id, name)
+    now = time.monotonic()
+    hit = _cmd_cache.get(key)
+    if hit and now - hit[0] < ttl:
+        return hit[1]
+    cmd = discord.utils.get(await safe_fetch_commands(ch), name=name)
+    if cmd is not None:           # don't pin a failed lookup
+        _cmd_cache[key] = (now, cmd)
+    return cmd
+
+def _drop_cached_commands(label: str) -> None:
+    """Forget `label`'s cached commands once the client that fetched them is gone."""
+    for key in [k for k in _cmd_cache if k[0] == label]:
+        del _cmd_cache[key]
+
+def _channel(bot, cid):
+    """Channel from the per-session cache, resolving it live on a cold miss."""
+    return bot._chans.get(cid) or bot.get_channel(cid)
+
+async def _delayed_send(bot, dest: int, payload: str, delay: float, waiting: dict) -> None:
+    await asyncio.sleep(delay)
+    waiting.pop(asyncio.current_task(), None)   # sending now: not re-queued on cancel
+    try:
+        await _channel(bot, dest).send(payload)
+    except Exception as e:
+        log.warning("[%s] forward to %s failed: %r", bot.label, dest, e)
+
+async def _forwarder(bot):
+    """Drain the bot's send queue so the message handlers never sleep
+    themselves. Each forward is scheduled as its own task that sleeps its
+    jitter and sends, so nothing queued waits behind an earlier forward."""
+    q, _uniform = bot._send_q, bot._rng.uniform
+    tasks = set()
+    waiting = {}                  # task -> queued item, while it sleeps its jitter
+    try:
+        while True:
+            item = await q.get()
+            dest, payload, (lo, hi) = item
+            task = asyncio.create_task(_delayed_send(bot, dest, payload, _uniform(lo, hi), waiting))
+            waiting[task] = item
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+            task.add_done_callback(lambda _: q.task_done())
+    finally:
+        # cancelled on disconnect: forwards still inside their jitter go back on
+        # the queue for the next session instead of being dropped, ahead of
+        # what was queued after them
+        rest = []
+        while not q.empty():
+            rest.append(q.get_nowait())
+            q.task_done()
+        for task in waiting:
+            task.cancel()
+        for item in [*waiting.values(), *rest]:
+            q.put_nowait(item)
+        waiting.clear()
+
 # ── ROLE ROTATION FUNCTIONS ───────────────────────────────────────────────
+def _next_role(current, nxt: dict, first: str, exclude):
+    """First active candidate after `current` in rotation order, skipping
+    `exclude`; starts over from `first` when `current` itself isn't eligible.
+    None if no candidate is."""
+    eligible = current in nxt and current in REG.active_bots and current != exclude
+    cand = nxt[current] if eligible else first
+    for _ in range(len(nxt)):
+        if cand in REG.active_bots and cand != exclude:
+            return cand
+        cand = nxt[cand]
+    return None
+
 def rotate_tt_roles():
     """Rotate which bots handle TT commands and scanning."""
-    global tt_command_bot, tt_scanner_bot, active_bots
 
     # Store old command bot for later
-    old_command_bot = tt_command_bot
+    old_command_bot = REG.tt_command_bot
 
-    # Get available command candidates (excluding current scanner bot)
-    available_cmd_bots = [bot for bot in tt_command_candidates if bot in active_bots and bot != tt_scanner_bot]
-
-    # Get available scanner candidates (excluding current command bot)
-    available_scan_bots = [bot for bot in tt_scanner_candidates if bot in active_bots and bot != tt_command_bot]
+    # Next command bot (excluding current scanner bot) and next scanner bot
+    # (excluding current command bot)
+    new_cmd  = _next_role(REG.tt_command_bot, _TT_CMD_NEXT, tt_command_candidates[0], REG.tt_scanner_bot)
+    new_scan = _next_role(REG.tt_scanner_bot, _TT_SCAN_NEXT, tt_scanner_candidates[0], REG.tt_command_bot)
 
     # If we have available bots, rotate roles
-    if available_cmd_bots and available_scan_bots:
-        # If there's a current command bot, move to next in rotation
-        if tt_command_bot in available_cmd_bots:
-            idx = available_cmd_bots.index(tt_command_bot)
-            tt_command_bot = available_cmd_bots[(idx + 1) % len(available_cmd_bots)]
-        else:
-            tt_command_bot = available_cmd_bots[0]
-
-        # If there's a current scanner bot, move to next in rotation
-        if tt_scanner_bot in available_scan_bots:
-            idx = available_scan_bots.index(tt_scanner_bot)
-            tt_scanner_bot = available_scan_bots[(idx + 1) % len(available_scan_bots)]
-        else:
-            tt_scanner_bot = available_scan_bots[0]
+    if new_cmd and new_scan:
+        REG.tt_command_bot, REG.tt_scanner_bot = new_cmd, new_scan
 
-        log.info("[TT_ROTATION] New roles - Command: %s, Scanner: %s", tt_command_bot, tt_scanner_bot)
+        log.info("[TT_ROTATION] New roles - Command: %s, Scanner: %s", REG.tt_command_bot, REG.tt_scanner_bot)
 
         # If command bot changed, transfer tasks to the new bot
-        if old_command_bot != tt_command_bot:
+        if old_command_bot != REG.tt_command_bot:
             # Use bot_instances dictionary instead of discord.client._clients
             # Reset the _tt_started flag on the old bot if it exists
-            if old_command_bot in bot_instances:
-                old_bot = bot_instances[old_command_bot]
+            if old_command_bot in REG.bot_instances:
+                old_bot = REG.bot_instances[old_command_bot]
                 # Stop the task loop if it exists
-                if hasattr(old_bot, '_tt_loop') and old_bot._tt_loop.is_running():
+                if hasattr(old_bot, '_tt_loop') and not old_bot._tt_loop.done():
                     old_bot._tt_loop.cancel()
                     log.info("[%s] TT command task loop stopped", old_command_bot)
                 old_bot._tt_started = False
                 log.info("[%s] TT command tasks detached from old bot", old_command_bot)
 
             # Attach tasks to the new command bot
-            if tt_command_bot in bot_instances:
-                new_bot = bot_instances[tt_command_bot]
+            if REG.tt_command_bot in REG.bot_instances:
+                new_bot = REG.bot_instances[REG.tt_command_bot]
                 # Reset the flag first to ensure tasks are attached
                 new_bot._tt_started = False
                 _attach_tt_tasks(new_bot)
-                log.info("[%s] TT command tasks transferred to new bot", tt_command_bot)
+                log.info("[%s] TT command tasks transferred to new bot", REG.tt_command_bot)
     else:
         log.warning("[TT_ROTATION] Not enough available bots for rotation")
 
 def rotate_burp_roles():
     """Rotate which bots handle BURP commands and scanning."""
-    global burp_command_bot, burp_scanner_bot, active_bots
 
     # Store old command bot for later
-    old_command_bot = burp_command_bot
+    old_command_bot = REG.burp_command_bot
 
-    # Get available command candidates (excluding current scanner bot)
-    available_cmd_bots = [bot for bot in burp_command_candidates if bot in active_bots and bot != burp_scanner_bot]
-
-    # Get available scanner candidates (excluding current command bot)
-    available_scan_bots = [bot for bot in burp_scanner_candidates if bot in active_bots and bot != burp_command_bot]
+    # Next command bot (excluding current scanner bot) and next scanner bot
+    # (excluding current command bot)
+    new_cmd  = _next_role(REG.burp_command_bot, _BURP_CMD_NEXT, burp_command_candidates[0], REG.burp_scanner_bot)
+    new_scan = _next_role(REG.burp_scanner_bot, _BURP_SCAN_NEXT, burp_scanner_candidates[0], REG.burp_command_bot)
 
     # If we have available bots, rotate roles
-    if available_cmd_bots and available_scan_bots:
-        # If there's a current command bot, move to next in rotation
-        if burp_command_bot in available_cmd_bots:
-            idx = available_cmd_bots.index(burp_command_bot)
-            burp_command_bot = available_cmd_bots[(idx + 1) % len(available_cmd_bots)]
-        else:
-            burp_command_bot = available_cmd_bots[0]
-
-        # If there's a current scanner bot, move to next in rotation
-        if burp_scanner_bot in available_scan_bots:
-            idx = available_scan_bots.index(burp_scanner_bot)
-            burp_scanner_bot = available_scan_bots[(idx + 1) % len(available_scan_bots)]
-        else:
-            burp_scanner_bot = available_scan_bots[0]
+    if new_cmd and new_scan:
+        REG.burp_command_bot, REG.burp_scanner_bot = new_cmd, new_scan
 
-        log.info("[BURP_ROTATION] New roles - Command: %s, Scanner: %s", burp_command_bot, burp_scanner_bot)
+        log.info("[BURP_ROTATION] New roles - Command: %s, Scanner: %s", REG.burp_command_bot, REG.burp_scanner_bot)
 
         # If command bot changed, transfer tasks to the new bot
-        if old_command_bot != burp_command_bot:
+        if old_command_bot != REG.burp_command_bot:
             # Use bot_instances dictionary instead of discord.client._clients
             # Reset the _burp_started flag on the old bot if it exists
-            if old_command_bot in bot_instances:
-                old_bot = bot_instances[old_command_bot]
+            if old_command_bot in REG.bot_instances:
+                old_bot = REG.bot_instances[old_command_bot]
                 # Stop the task loop if it exists
-                if hasattr(old_bot, '_burp_loop') and old_bot._burp_loop.is_running():
+                if hasattr(old_bot, '_burp_loop') and not old_bot._burp_loop.done():
                     old_bot._burp_loop.cancel()
                     log.info("[%s] BURP command task loop stopped", old_command_bot)
                 old_bot._burp_started = False
                 log.info("[%s] BURP command tasks detached from old bot", old_command_bot)
 
             # Attach tasks to the new command bot
-            if burp_command_bot in bot_instances:
-                new_bot = bot_instances[burp_command_bot]
+            if REG.burp_command_bot in REG.bot_instances:
+                new_bot = REG.bot_instances[REG.burp_command_bot]
                 # Reset the flag first to ensure tasks are attached
                 new_bot._burp_started = False
                 _attach_burp_tasks(new_bot)
-                log.info("[%s] BURP command tasks transferred to new bot", burp_command_bot)
+                log.info("[%s] BURP command tasks transferred to new bot", REG.burp_command_bot)
     else:
         log.warning("[BURP_ROTATION] Not enough available bots for rotation")
 
+_roles_ready = asyncio.Event()   # set while both command roles are assigned
+
 def initialize_roles_if_needed():
     """Initialize roles if they haven't been set yet."""
-    global tt_command_bot, tt_scanner_bot, burp_command_bot, burp_scanner_bot, active_bots
 
     # Initialize TT roles if needed
-    if (tt_command_bot is None or tt_scanner_bot is None) and len(active_bots) >= 2:
-        available_cmd_bots = [bot for bot in tt_command_candidates if bot in active_bots]
-        available_scan_bots = [bot for bot in tt_scanner_candidates if bot in active_bots]
+    if (REG.tt_command_bot is None or REG.tt_scanner_bot is None) and len(REG.active_bots) >= 2:
+        available_cmd_bots = [bot for bot in tt_command_candidates if bot in REG.active_bots]
+        available_scan_bots = [bot for bot in tt_scanner_candidates if bot in REG.active_bots]
 
         if available_cmd_bots and available_scan_bots:
-            tt_command_bot = available_cmd_bots[0]
-            tt_scanner_bot = available_scan_bots[0]
+            REG.tt_command_bot = available_cmd_bots[0]
+            REG.tt_scanner_bot = available_scan_bots[0]
             log.info("[INIT_ROLES] TT roles initialized - Command: %s, Scanner: %s (active_bots: %s)", 
-                    tt_command_bot, tt_scanner_bot, active_bots)
+                    REG.tt_command_bot, REG.tt_scanner_bot, REG.active_bots)
 
     # Initialize BURP roles if needed
-    if (burp_command_bot is None or burp_scanner_bot is None) and len(active_bots) >= 2:
-        available_cmd_bots = [bot for bot in burp_command_candidates if bot in active_bots]
-        available_scan_bots = [bot for bot in burp_scanner_candidates if bot in active_bots]
+    if (REG.burp_command_bot is None or REG.burp_scanner_bot is None) and len(REG.active_bots) >= 2:
+        available_cmd_bots = [bot for bot in burp_command_candidates if bot in REG.active_bots]
+        available_scan_bots = [bot for bot in burp_scanner_candidates if bot in REG.active_bots]
 
         if available_cmd_bots and available_scan_bots:
-            burp_command_bot = available_cmd_bots[0]
-            burp_scanner_bot = available_scan_bots[0]
+            REG.burp_command_bot = available_cmd_bots[0]
+            REG.burp_scanner_bot = available_scan_bots[0]
             log.info("[INIT_ROLES] BURP roles initialized - Command: %s, Scanner: %s (active_bots: %s)", 
-                    burp_command_bot, burp_scanner_bot, active_bots)
+                    REG.burp_command_bot, REG.burp_scanner_bot, REG.active_bots)
+
+    # Wake the bots waiting in check_and_attach_tasks (or make them wait again
+    # after a disconnect left a command role unassigned)
+    if REG.tt_command_bot is not None and REG.burp_command_bot is not None:
+        _roles_ready.set()
+    else:
+        _roles_ready.clear()
+
+# ── EMBED PARSING (shared by on_message / on_message_edit) ────────────────
+def _process_burp_embed(bot: commands.Bot, desc: str) -> None:
+    """Queue the burp tokens of an embed description for forwarding."""
+    if "Δ" not in desc:
+        return
+    dbg = log.isEnabledFor(logging.DEBUG)
+    seen, put = burp_cycle_processed, bot._send_q.put_nowait
+    # one match per line carrying both a Δ% and a URL
+    for line_m in BURP_LINE_RE.finditer(desc):
+        pct_s, url = line_m.groups()
+
+        # extract token
+        token = tail_token(url)
+        if token is None:
+            if dbg:
+                log.debug("Skip URL (no token): %s", url)
+            continue
+        key = hash(token)
+        pct = float(pct_s)
+
+        # If it's non-negative and we've already seen it, skip.
+        if pct >= 0 and key in seen:
+            if dbg:
+                log.debug(
+                    "Skip token %s — already processed non-negative Δ (%.2f%%)",
+                    token, pct
+                )
+            continue
+
+        # Otherwise, we should copy it:
+        #  • negative Δ: always
+        #  • new token with Δ ≥ 0: first time
+        seen.add(key)
+
+        if pct < 0:
+            log.info("Burping token (negative Δ): %s (%.1f%%)", token, pct)
+        else:
+            log.info("Burping new token: %s (%.1f%%)", token, pct)
+
+        put((GL_CH_ID, token, BURP_DELAY))
+
+def _process_tt_embed(bot: commands.Bot, desc: str, msg_id: int) -> None:
+    """Queue the not-yet-forwarded tweet URLs of a /tt result embed."""
+    if msg_id in processed_tt_embeds:
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Skip embed %s — duplicate", msg_id)
+        return
+    processed_tt_embeds.add(msg_id)
+
+    if "twitter.com" not in desc:
+        return
+    # unique URLs in embed order, minus the ones already forwarded
+    urls = dict.fromkeys(m.group(1) for m in TW_URL_RE.finditer(desc))
+    new = [url for url in urls if hash(url) not in processed_tweets]
+    processed_tweets.update(map(hash, new))
+    # one message per ≤ MSG_CHUNK chars of newline-joined URLs instead of one each
+    chunk, size = [], 0
+    for url in new:
+        log.info("[%s] Forwarding tweet: %s", bot.label, url)
+        if chunk and size + 1 + len(url) > MSG_CHUNK:
+            bot._send_q.put_nowait((X_CH_ID, "\n".join(chunk), TWEET_DELAY))
+            chunk, size = [], 0
+        chunk.append(url)
+        size += len(url) + 1
+    if chunk:
+        bot._send_q.put_nowait((X_CH_ID, "\n".join(chunk), TWEET_DELAY))
+
+# ── CONTROL COMMANDS ──────────────────────────────────────────────────────
+async def _tt_start(bot, msg, txt):
+    CONFIG.tt_on = True
+    save_state()  # Save the updated state
+    # Restart TT tasks on the current command bot
+    if bot.label == REG.tt_command_bot:
+        # Reset the flag to ensure tasks are attached
+        bot._tt_started = False
+        _attach_tt_tasks(bot)
+        log.info("[%s] TT tasks restarted after 'tt start' command", bot.label)
+    return await msg.channel.send("TT on")
+
+async def _tt_stop(bot, msg, txt):
+    CONFIG.tt_on = False
+    save_state()  # Save the updated state
+    _tt_kick.set()
+    return await msg.channel.send("TT off")
+
+async def _tt_config(bot, msg, txt):
+    _, _, cd, dmin, dmax = txt.split(maxsplit=5)[:5]
+    CONFIG.command_delay = int(cd)
+    CONFIG.copy_min      = int(dmin)
+    CONFIG.copy_max      = int(dmax)
+    log.info("TT config: %s %s-%s", cd, dmin, dmax)
+    _tt_kick.set()
+    return await msg.channel.send("TT config updated")
+
+async def _burp_start(bot, msg, txt):
+    CONFIG.burp_on = True
+    save_state()  # Save the updated state
+    # Restart BURP tasks on the current command bot
+    if bot.label == REG.burp_command_bot:
+        # Reset the flag to ensure tasks are attached
+        bot._burp_started = False
+        _attach_burp_tasks(bot)
+        log.info("[%s] BURP tasks restarted after 'burp start' command", bot.label)
+    return await msg.channel.send("Burp on")
+
+async def _burp_stop(bot, msg, txt):
+    CONFIG.burp_on = False
+    save_state()  # Save the updated state
+    _burp_kick.set()
+    return await msg.channel.send("Burp off")
+
+async def _burp_config(bot, msg, txt):
+    CONFIG.burp_cooldown = int(txt.split(maxsplit=3)[2])
+    log.info("Burp cooldown: %s", CONFIG.burp_cooldown)
+    _burp_kick.set()
+    return await msg.channel.send("Burp cooldown updated")
+
+# channel id -> (exact commands, config prefix, config handler); one dict
+# lookup per message instead of walking the if-ladder
+_CONTROLS = {
+    TT_CH_ID:   ({"tt start": _tt_start, "tt stop": _tt_stop}, "tt config", _tt_config),
+    BURP_CH_ID: ({"burp start": _burp_start, "burp stop": _burp_stop}, "burp config", _burp_config),
+}
 
 # ── BOT FACTORY ───────────────────────────────────────────────────────────
 def make_bot(label: str) -> commands.Bot:
-    bot = commands.Bot(command_prefix="!", self_bot=True)
+    bot = commands.Bot(command_prefix="!", self_bot=True, connector=shared_connector())
     bot.label = label
+    bot._send_q = asyncio.Queue()   # (dest channel id, payload, delay range)
+    bot._fwd_task = None
+    bot._chans = {}                 # channel id -> channel, filled on ready
+    bot._http_err_ts = []           # recent REST error times, see _should_recreate_http
+    bot._recreate_http = _recreate_http(bot)   # shared by the tt/burp loops and the runner
+    bot._rng = random.Random(os.urandom(8))    # this bot's delays / intervals
+    bot._tt_started = bot._burp_started = False   # set by _attach_*_tasks
+    bot._healthy = False            # reached on_ready this session, see runner
 
     # Add bot to bot_instances dictionary
-    global bot_instances
-    bot_instances[label] = bot
+    REG.bot_instances[label] = bot
 
     @bot.event
     async def on_ready():
-        global active_bots, tt_command_bot, burp_command_bot
         log.info("[%s] ready as %s", label, bot.user)
+        bot._healthy = True
         update_hb()                       # first heartbeat
 
+        # Resolve the channels we post to once per session
+        bot._chans = {cid: bot.get_channel(cid)
+                      for cid in (GL_CH_ID, X_CH_ID, CALL_CH_ID, TT_CH_ID, BURP_CH_ID, CMD_CH)}
+
+        # Start the outbound forwarder once per bot (on_ready fires again on resume)
+        if bot._fwd_task is None or bot._fwd_task.done():
+            bot._fwd_task = asyncio.create_task(_forwarder(bot))
+
         # Add this bot to active bots
-        active_bots.add(label)
+        REG.active_bots.add(label)
 
         # Initialize roles if needed
         initialize_roles_if_needed()
 
-        # Schedule a task to check and attach tasks after a short delay
-        # This ensures roles are initialized before we check if this bot should attach tasks
+        # Attach this bot's command tasks once the roles are initialized
         asyncio.create_task(check_and_attach_tasks(bot, label))
 
-    async def check_and_attach_tasks(bot, label, max_retries=5, retry_delay=1.0):
+    async def check_and_attach_tasks(bot, label):
         """Check if this bot should attach tasks and do so if needed.
-        Retry a few times to ensure roles are initialized."""
-        global tt_command_bot, burp_command_bot
-
-        for retry in range(max_retries):
-            # Initialize roles again in case they weren't initialized yet
-            initialize_roles_if_needed()
-
-            # Check if roles are assigned
-            if tt_command_bot is None or burp_command_bot is None:
-                log.debug("[%s] Roles not fully initialized yet, retry %d/%d (tt_command_bot=%s, burp_command_bot=%s)", 
-                         label, retry + 1, max_retries, tt_command_bot, burp_command_bot)
-                await asyncio.sleep(retry_delay)
-                continue
-
-            # Attach TT tasks if this bot is the current TT command bot
-            if label == tt_command_bot and not getattr(bot, "_tt_started", False):
-                _attach_tt_tasks(bot)
-                log.info("[%s] selected for TT command tasks (retry %d)", label, retry)
-
-            # Attach BURP tasks if this bot is the current BURP command bot
-            if label == burp_command_bot and not getattr(bot, "_burp_started", False):
-                _attach_burp_tasks(bot)
-                log.info("[%s] selected for BURP command tasks (retry %d)", label, retry)
-
-            # If we got here, we've checked and potentially attached tasks
-            log.debug("[%s] Successfully checked and attached tasks (retry %d)", label, retry)
-            return
-
-        # If we've exhausted retries and roles still aren't initialized
-        if tt_command_bot is None or burp_command_bot is None:
-            log.warning("[%s] Failed to initialize roles after %d retries", 
-                       label, max_retries)
-        else:
-            # Final check in case roles were initialized on the last retry
-            if label == tt_command_bot and not getattr(bot, "_tt_started", False):
-                _attach_tt_tasks(bot)
-                log.info("[%s] selected for TT command tasks (final check)", label)
-
-            if label == burp_command_bot and not getattr(bot, "_burp_started", False):
-                _attach_burp_tasks(bot)
-                log.info("[%s] selected for BURP command tasks (final check)", label)
+        Waits for the roles to be initialized, however long the other bots take."""
+        # Initialize roles again in case they weren't initialized yet
+        initialize_roles_if_needed()
+        await _roles_ready.wait()
+        if label not in REG.active_bots or REG.bot_instances.get(label) is not bot:
+            return                        # this session ended (or the bot was rebuilt) meanwhile
+
+        # No await between reading the roles and the attach, so two bots
+        # becoming ready together cannot both claim the same role
+        if label == REG.tt_command_bot and not bot._tt_started:
+            _attach_tt_tasks(bot)
+            log.info("[%s] selected for TT command tasks", label)
+        if label == REG.burp_command_bot and not bot._burp_started:
+            _attach_burp_tasks(bot)
+            log.info("[%s] selected for BURP command tasks", label)
 
     # ── Handlers for scanning bots ──────────────────────────────────────────────
     # Check if this bot is assigned to scanner role for either TT or BURP
@@ -518,246 +893,88 @@ def make_bot(label: str) -> commands.Bot:
 
         @bot.event
         async def on_message_edit(_, after):
+            if after.channel.id not in _EMBED_IDS:
+                return None
             if (
-                    isMonitoringBurp
-                    and label == burp_scanner_bot  # Only process if this bot is the burp scanner
+                    CONFIG.burp_on
+                    and label == REG.burp_scanner_bot  # Only process if this bot is the burp scanner
                     and after.author.id == RICK_APP_ID
                     and after.channel.id == BURP_CH_ID
                     and after.embeds
             ):
-                desc = after.embeds[0].description or ""
-                for line in desc.splitlines():
-                    if "Δ" not in line:
-                        continue
-
-                    # extract URL
-                    url_m = re.search(r"https?://\S+", line)
-                    if not url_m:
-                        log.debug("Skip embed line (no URL)")
-                        continue
-                    raw = re.sub(r"[^A-Za-z0-9x]+$", "", url_m.group(0).rstrip("/"))
-
-                    # extract token
-                    tok_m = TOKEN_RE.search(raw)
-                    if not tok_m:
-                        log.debug("Skip URL (no token): %s", raw)
-                        continue
-                    token = tok_m.group(1)
-
-                    # extract percentage
-                    pct_m = re.search(r"Δ\s*([-.\d]+)%", line)
-                    if not pct_m:
-                        log.debug("Skip embed line (no Δ%%): %s", line)
-                        continue
-                    pct = float(pct_m.group(1))
-
-                    # ——— NEW LOGIC ———
-                    # If it's non-negative and we've already seen it, skip.
-                    if pct >= 0 and token in burp_cycle_processed:
-                        log.debug(
-                            "Skip token %s — already processed non-negative Δ (%.2f%%)",
-                            token, pct
-                        )
-                        continue
-
-                    # Otherwise, we should copy it:
-                    #  • negative Δ: always
-                    #  • new token with Δ ≥ 0: first time
-                    burp_cycle_processed.add(token)
-
-                    if pct < 0:
-                        log.info("Burping token (negative Δ): %s (%.1f%%)", token, pct)
-                    else:
-                        log.info("Burping new token: %s (%.1f%%)", token, pct)
-
-                    # Add variation between 1 and 15 seconds
-                    await asyncio.sleep(random.uniform(1, 15))
-                    await bot.get_channel(GL_CH_ID).send(token)
+                _process_burp_embed(bot, after.embeds[0].description or "")
             # — TT embed tweets —
             if (
-                    isMonitoringTT 
-                    and label == tt_scanner_bot  # Only process if this bot is the tt scanner
+                    CONFIG.tt_on
+                    and label == REG.tt_scanner_bot  # Only process if this bot is the tt scanner
                     and after.author.id == RICK_APP_ID
                     and after.channel.id == CMD_CH
+                    and after.embeds
             ):
-                if after.id in processed_tt_embeds:
-                    log.debug("Skip embed %s — duplicate", after.id)
-                    return None
-                processed_tt_embeds.add(after.id)
-
-                for line in (after.embeds[0].description or "").splitlines():
-                    m = TW_URL_RE.search(line)
-                    if not m:
-                        continue
-                    url = m.group(1)
-                    if url in processed_tweets:
-                        log.debug("Skip tweet duplicate: %s", url)
-                        continue
-                    processed_tweets.add(url)
-                    log.info("[%s] Forwarding tweet: %s", label, url)
-                    # Add variation between 1 and 15 seconds
-                    await asyncio.sleep(random.uniform(10, 35))
-                    await bot.get_channel(X_CH_ID).send(url)
+                _process_tt_embed(bot, after.embeds[0].description or "", after.id)
                 return None
             return None
 
         @bot.event
         async def on_message(msg: discord.Message):
-            global isMonitoringTT, isMonitoringBurp
-
-            # ignore self
-            if msg.author.id == bot.user.id:
+            cid = msg.channel.id
+            if cid not in _INTERESTING_IDS:
+                return None
+            aid = msg.author.id
+            if aid == bot.user.id:      # ignore self
                 return None
 
-            txt = msg.content.strip().lower()
-
-            # — TT controls —
-            if msg.channel.id == TT_CH_ID and msg.author.id in ALLOWED_AUTHORS:
-                if txt == "tt start":
-                    isMonitoringTT = True
-                    save_state()  # Save the updated state
-                    # Restart TT tasks on the current command bot
-                    if label == tt_command_bot:
-                        # Reset the flag to ensure tasks are attached
-                        bot._tt_started = False
-                        _attach_tt_tasks(bot)
-                        log.info("[%s] TT tasks restarted after 'tt start' command", label)
-                    return await msg.channel.send("TT on")
-                if txt == "tt stop":
-                    isMonitoringTT = False
-                    save_state()  # Save the updated state
-                    return await msg.channel.send("TT off")
-                if txt.startswith("tt config"):
-                    _, _, cd, dmin, dmax = txt.split()[:5]
-                    globals().update(
-                        COMMAND_DELAY=int(cd),
-                        COPY_DELAY_MIN=int(dmin),
-                        COPY_DELAY_MAX=int(dmax),
-                    )
-                    log.info("TT config: %s %s-%s", cd, dmin, dmax)
-                    return await msg.channel.send("TT config updated")
-
-            # — Burp controls —
-            if msg.channel.id == BURP_CH_ID and msg.author.id in ALLOWED_AUTHORS:
-                if txt == "burp start":
-                    isMonitoringBurp = True
-                    save_state()  # Save the updated state
-                    # Restart BURP tasks on the current command bot
-                    if label == burp_command_bot:
-                        # Reset the flag to ensure tasks are attached
-                        bot._burp_started = False
-                        _attach_burp_tasks(bot)
-                        log.info("[%s] BURP tasks restarted after 'burp start' command", label)
-                    return await msg.channel.send("Burp on")
-                if txt == "burp stop":
-                    isMonitoringBurp = False
-                    save_state()  # Save the updated state
-                    return await msg.channel.send("Burp off")
-                if txt.startswith("burp config"):
-                    globals().update(BURP_COOLDOWN=int(txt.split()[2]))
-                    log.info("Burp cooldown: %s", BURP_COOLDOWN)
-                    return await msg.channel.send("Burp cooldown updated")
+            # — TT / Burp controls — (allowed authors in the two control channels)
+            ctl = _CONTROLS.get(cid)
+            if ctl is not None and aid in ALLOWED_AUTHORS:
+                txt = msg.content.strip().lower()
+                exact, cfg_prefix, cfg = ctl
+                handler = exact.get(txt) or (cfg if txt.startswith(cfg_prefix) else None)
+                if handler is not None:
+                    return await handler(bot, msg, txt)
 
             # — New Burp‐forwarding logic on fresh messages —
             if (
-                    isMonitoringBurp
-                    and label == burp_scanner_bot  # Only process if this bot is the burp scanner
-                    and msg.channel.id == BURP_CH_ID
-                    and msg.author.id in ALLOWED_AUTHORS
+                    CONFIG.burp_on
+                    and label == REG.burp_scanner_bot  # Only process if this bot is the burp scanner
+                    and cid == BURP_CH_ID
+                    and aid in ALLOWED_AUTHORS
                     and msg.embeds
             ):
-                desc = msg.embeds[0].description or ""
-                for line in desc.splitlines():
-                    if "Δ" not in line:
-                        continue
-
-                    # extract URL
-                    url_m = re.search(r"https?://\S+", line)
-                    if not url_m:
-                        log.debug("Skip embed line (no URL)")
-                        continue
-                    raw = re.sub(r"[^A-Za-z0-9x]+$", "", url_m.group(0).rstrip("/"))
-
-                    # extract token
-                    tok_m = TOKEN_RE.search(raw)
-                    if not tok_m:
-                        log.debug("Skip URL (no token): %s", raw)
-                        continue
-                    token = tok_m.group(1)
-
-                    # extract percentage
-                    pct_m = re.search(r"Δ\s*([-.\d]+)%", line)
-                    if not pct_m:
-                        log.debug("Skip embed line (no Δ%%): %s", line)
-                        continue
-                    pct = float(pct_m.group(1))
-
-                    # skip repeats of non-negative Δ
-                    if pct >= 0 and token in burp_cycle_processed:
-                        log.debug(
-                            "Skip token %s — already processed non-negative Δ (%.2f%%)",
-                            token, pct
-                        )
-                        continue
-
-                    # otherwise, forward
-                    burp_cycle_processed.add(token)
-                    if pct < 0:
-                        log.info("Burping token (negative Δ): %s (%.1f%%)", token, pct)
-                    else:
-                        log.info("Burping new token: %s (%.1f%%)", token, pct)
-
-                    # Add variation between 1 and 15 seconds
-                    await asyncio.sleep(random.uniform(1, 15))
-                    await bot.get_channel(GL_CH_ID).send(token)
-
+                _process_burp_embed(bot, msg.embeds[0].description or "")
                 return None
 
             # — TT embed tweets —
             if (
-                    isMonitoringTT 
-                    and label == tt_scanner_bot  # Only process if this bot is the tt scanner
-                    and msg.author.id == RICK_APP_ID
-                    and msg.channel.id == CMD_CH 
+                    CONFIG.tt_on
+                    and label == REG.tt_scanner_bot  # Only process if this bot is the tt scanner
+                    and aid == RICK_APP_ID
+                    and cid == CMD_CH 
                     and msg.embeds
             ):
-                print(msg)
-                if msg.id in processed_tt_embeds:
-                    log.debug("Skip embed %s — duplicate", msg.id)
-                    return None
-                processed_tt_embeds.add(msg.id)
-
-                for line in (msg.embeds[0].description or "").splitlines():
-                    m = TW_URL_RE.search(line)
-                    if not m:
-                        continue
-                    url = m.group(1)
-                    if url in processed_tweets:
-                        log.debug("Skip tweet duplicate: %s", url)
-                        continue
-                    processed_tweets.add(url)
-                    log.info("Forwarding tweet: %s", url)
-                    # Add variation between 1 and 15 seconds
-                    await asyncio.sleep(random.uniform(10, 35))
-                    await bot.get_channel(X_CH_ID).send(url)
+                if log.isEnabledFor(logging.DEBUG):
+                    log.debug("TT embed message id=%s embeds=%d", msg.id, len(msg.embeds))
+                _process_tt_embed(bot, msg.embeds[0].description or "", msg.id)
                 return None
 
             # — Raw tweets —
-            if msg.channel.id == TT_CH_ID and not msg.author.bot and label == tt_scanner_bot:  # Only process if this bot is the tt scanner
+            if cid == TT_CH_ID and not msg.author.bot and label == REG.tt_scanner_bot:  # Only process if this bot is the tt scanner
+                if "twitter.com" not in msg.content:
+                    return None
                 for m in TW_URL_RE.finditer(msg.content):
                     url = m.group(1)
-                    if url in processed_tweets:
-                        log.debug("Skip tweet duplicate: %s", url)
+                    key = hash(url)
+                    if key in processed_tweets:
+                        if log.isEnabledFor(logging.DEBUG):
+                            log.debug("Skip tweet duplicate: %s", url)
                         continue
-                    processed_tweets.add(url)
+                    processed_tweets.add(key)
 
-                    dest = CALL_CH_ID if re.search(r"\b0x[a-fA-F0-9]{40}\b", msg.content) else X_CH_ID
+                    dest = CALL_CH_ID if has_eth_addr(msg.content) else X_CH_ID
                     cname = "CALL" if dest == CALL_CH_ID else "X"
                     log.info("Forwarding tweet to %s: %s", cname, url)
 
-                    # Add variation between 10 and 35 seconds
-                    await asyncio.sleep(random.uniform(10, 35))
-                    await bot.get_channel(dest).send(url)
+                    bot._send_q.put_nowait((dest, url, TWEET_DELAY))
                     return None
                 return None
             return None
@@ -765,19 +982,23 @@ def make_bot(label: str) -> commands.Bot:
 
 # ── TASKS & RECOVERY ──────────────────────────────────────────────────────
 def _recreate_http(bot: commands.Bot):
-    """Helper function to recreate the HTTP client."""
-    async def recreate_http():
+    """Helper function to recreate the HTTP client.
+
+    With login=False the fresh client is only swapped in; the next bot.login()
+    authenticates it (used when the runner reopens a closed bot)."""
+    # proxy settings never change after construction: read them once
+    proxy, proxy_auth = getattr(bot.http, "proxy", None), getattr(bot.http, "proxy_auth", None)
+
+    async def recreate_http(login=True):
         old, token = bot.http, bot.http.token
-        connector  = None if getattr(old, "connector", None) in (None, MISSING) else old.connector
-        proxy, proxy_auth = getattr(old, "proxy", None), getattr(old, "proxy_auth", None)
         try: await old.close()
         except Exception: pass
 
         # Initialize HTTPClient without the loop parameter as it's no longer accepted
         new_http = HTTPClient(proxy=proxy, proxy_auth=proxy_auth)
-        if connector is not None:
-            new_http.connector = connector
-        await new_http.static_login(token)
+        new_http.connector = shared_connector()
+        if login:
+            await new_http.static_login(token)
 
         bot.http = new_http
         bot._connection.http = new_http
@@ -786,51 +1007,86 @@ def _recreate_http(bot: commands.Bot):
 
     return recreate_http
 
+def _should_recreate_http(bot: commands.Bot) -> bool:
+    """Record a REST error; True when it is the second within HTTP_ERR_WINDOW,
+    so a single transient failure doesn't cost a full session rebuild."""
+    now = time.time()
+    bot._http_err_ts = [t for t in bot._http_err_ts if now - t < HTTP_ERR_WINDOW] + [now]
+    if len(bot._http_err_ts) >= 2:
+        bot._http_err_ts.clear()
+        return True
+    return False
+
+# Set by the tt/burp control commands so a loop sleeping towards its deadline
+# wakes up and re-reads CONFIG (new delay / cooldown, or monitoring stopped)
+_tt_kick   = asyncio.Event()
+_burp_kick = asyncio.Event()
+
+async def _sleep_or_kick(kick: asyncio.Event, delay: float) -> None:
+    try:
+        await asyncio.wait_for(kick.wait(), delay)
+    except asyncio.TimeoutError:
+        return
+    kick.clear()
+
+_TT_INTERVALS = (180, 300, 480)   # seconds between /tt firings, before variation
+
+class _LoopState:
+    """Per-attach state of a tt/burp loop (the last-fired times stay module
+    globals so the next command bot picks up where this one left off)."""
+    __slots__ = ("fails", "interval", "variation")
+
+    def __init__(self, interval: int = 0, variation: float = 0.0):
+        self.fails = 0
+        self.interval = interval
+        self.variation = variation
+
 def _attach_tt_tasks(bot: commands.Bot):
     """Attach trending topics tasks to the bot."""
     bot._tt_started = True
-    global last_trending_time
+    bot._tt_ch = None   # command channel, fetched on first firing
     log.info("[%s] Attaching TT tasks - loop will start momentarily", bot.label)
 
-    recreate_http = _recreate_http(bot)
-    tt_fails = 0
     # Store the current interval and variation
-    current_interval = random.choice([180, 300, 480])
-    #current_interval = random.choice([1, 2, 3])
-    current_variation = random.uniform(0.1, 2.0)
+    rng = bot._rng
+    st = _LoopState(rng.choice(_TT_INTERVALS), rng.uniform(0.1, 2.0))
+    #st.interval = rng.choice((1, 2, 3))
 
-    @tasks.loop(seconds=1)  # We'll handle the interval manually
     async def tt_loop():
-        nonlocal tt_fails, current_interval, current_variation
+        """Sleep until the next /tt deadline, fire, repeat."""
         global last_trending_time
-        try:
-            # Check if this bot is still the command bot and monitoring is active
-            if not isMonitoringTT or bot.is_closed() or not getattr(bot, "_tt_started", False) or tt_command_bot != bot.label:
+        _now, _sleep, _is_closed = asyncio.get_running_loop().time, asyncio.sleep, bot.is_closed
+        _debug_on, _uniform, _choice = log.isEnabledFor, rng.uniform, rng.choice
+        while True:
+            # Stop once this bot loses the command role or monitoring is off;
+            # role rotation and 'tt start' attach a fresh loop
+            if not CONFIG.tt_on or _is_closed() or not bot._tt_started or REG.tt_command_bot != bot.label:
+                log.debug("[TT_LOOP] [%s] no longer active, loop exiting", bot.label)
                 return
 
-            current_time = time.time()
-            # Log current values for debugging
-            log.debug("[TT_LOOP] Debug values: last_trending_time=%.2f, current_time=%.2f, diff=%.2f, threshold=%d+%.2f",
-                     last_trending_time, current_time, current_time - last_trending_time, current_interval, current_variation)
-
-            if current_time - last_trending_time < COMMAND_DELAY:
-                log.debug("[TT_LOOP] Skipping due to COMMAND_DELAY: diff=%.2f < %d",
-                         current_time - last_trending_time, COMMAND_DELAY)
-                return
+            try:
+                current_time = _now()
+                time_diff = current_time - last_trending_time
+                threshold = max(st.interval + st.variation, CONFIG.command_delay)
+                if time_diff < threshold:
+                    if _debug_on(logging.DEBUG):
+                        log.debug("[TT_LOOP] Next /tt in %.2fs (interval %ds+%.2fs)",
+                                  threshold - time_diff, st.interval, st.variation)
+                    await _sleep_or_kick(_tt_kick, threshold - time_diff)
+                    continue
 
-            # If this is the first run or enough time has passed since last run
-            time_diff = current_time - last_trending_time
-            threshold = current_interval + current_variation
-            if last_trending_time == 0 or time_diff >= threshold:
-                log.debug("[TT_LOOP] Condition met: last_trending_time=%s, time_diff=%.2f, threshold=%.2f",
-                         "0" if last_trending_time == 0 else "%.2f" % last_trending_time, time_diff, threshold)
+                if _debug_on(logging.DEBUG):
+                    log.debug("[TT_LOOP] Condition met: last_trending_time=%.2f, time_diff=%.2f, threshold=%.2f",
+                             last_trending_time, time_diff, threshold)
                 # Execute the command
-                ch = await bot.fetch_channel(CMD_CH)
-                cmd = discord.utils.get(await safe_fetch_commands(ch), name="tt")
+                ch = bot._tt_ch or await bot.fetch_channel(CMD_CH)
+                bot._tt_ch = ch
+                guild = ch.guild
+                cmd = await cached_command(bot, ch, "tt")
                 if cmd:
                     # Log the interval that was used
-                    log.info("[TT_LOOP] firing /tt in #%s with interval %ds+%.2fs", ch.name, current_interval, current_variation)
-                    result = await safe_command_call(cmd, ch, ch.guild, client_bot=bot)
+                    log.info("[TT_LOOP] firing /tt in #%s with interval %ds+%.2fs", ch.name, st.interval, st.variation)
+                    result = await safe_command_call(cmd, ch, guild, client_bot=bot)
 
                     # Only update state if the command was actually executed (not discarded)
                     if result is not None:
@@ -838,76 +1094,86 @@ def _attach_tt_tasks(bot: commands.Bot):
                         last_trending_time = current_time
 
                         # Select a new interval and variation for the next run
-                        current_interval = random.choice([180, 300, 480])
-                        #current_interval = random.choice([1, 2, 3])
-                        current_variation = random.uniform(0.1, 2.0)  # Add 0.1 to 2.0 seconds of variation
+                        st.interval = _choice(_TT_INTERVALS)
+                        #st.interval = _choice((1, 2, 3))
+                        st.variation = _uniform(0.1, 2.0)  # Add 0.1 to 2.0 seconds of variation
 
                         # Rotate TT roles after successful command execution
                         rotate_tt_roles()
                         log.info("[TT_LOOP] Rotated TT roles after command execution")
 
-                        tt_fails = 0
+                        st.fails = 0
                         update_hb()                                   # successful loop
-                    else:
-                        log.info("[TT_LOOP] Command was discarded due to cooldown, not updating state")
-            else:
-                log.debug("[TT_LOOP] Condition not met: time_diff=%.2f < threshold=%.2f, waiting...",
-                         time_diff, threshold)
-        except NET_ERR as e:
-            tt_fails += 1
-            log.warning("[TT_LOOP] REST %r — recreate HTTP (%s/%s)", e, tt_fails, FAIL_THRESHOLD)
-            await recreate_http()
-            if tt_fails >= FAIL_THRESHOLD:
-                log.critical("[TT_LOOP] %s fails — hard exit", FAIL_THRESHOLD)
-                os._exit(1)
+                        continue
+                    log.info("[TT_LOOP] Command was discarded due to cooldown, not updating state")
+            except NET_ERR as e:
+                st.fails += 1
+                _cmd_cache.pop((bot.label, CMD_CH, "tt"), None)
+                bot._tt_ch = None
+                if _should_recreate_http(bot):
+                    log.warning("[TT_LOOP] REST %r — recreate HTTP (%s/%s)", e, st.fails, FAIL_THRESHOLD)
+                    await bot._recreate_http()
+                else:
+                    log.warning("[TT_LOOP] REST %r — keeping HTTP session (%s/%s)", e, st.fails, FAIL_THRESHOLD)
+                if st.fails >= FAIL_THRESHOLD:
+                    log.critical("[TT_LOOP] %s fails — hard exit", FAIL_THRESHOLD)
+                    _hard_exit(1)
+
+            # the firing did not go through; try again shortly
+            await _sleep(RETRY_TICK)
 
-    # Store the task loop in the bot instance so it can be accessed later
-    bot._tt_loop = tt_loop
-    tt_loop.start()
+    # Replace any loop still running on this bot, then keep the task so it can
+    # be cancelled on rotation / disconnect
+    old = getattr(bot, "_tt_loop", None)
+    if old is not None and not old.done():
+        old.cancel()
+    bot._tt_loop = asyncio.create_task(tt_loop())
 
 def _attach_burp_tasks(bot: commands.Bot):
     """Attach burp tasks to the bot."""
     bot._burp_started = True
-    global last_burp_time
+    bot._burp_ch = None   # burp channel, fetched on first firing
     log.info("[%s] Attaching BURP tasks - loop will start momentarily", bot.label)
 
-    recreate_http = _recreate_http(bot)
-    burp_fails = 0
     # Store the current variation
-    current_variation = random.uniform(5.0, 30.0)
+    rng = bot._rng
+    st = _LoopState(variation=rng.uniform(5.0, 30.0))
 
-    @tasks.loop(seconds=1)  # We'll handle the interval manually
     async def burp_loop():
-        nonlocal burp_fails, current_variation
+        """Sleep until the next /burp deadline, fire, repeat."""
         global last_burp_time
-        try:
-            # Check if this bot is still the command bot and monitoring is active
-            if not isMonitoringBurp or bot.is_closed() or not getattr(bot, "_burp_started", False) or burp_command_bot != bot.label:
+        _now, _sleep, _is_closed = asyncio.get_running_loop().time, asyncio.sleep, bot.is_closed
+        _debug_on, _uniform = log.isEnabledFor, rng.uniform
+        while True:
+            # Stop once this bot loses the command role or monitoring is off;
+            # role rotation and 'burp start' attach a fresh loop
+            if not CONFIG.burp_on or _is_closed() or not bot._burp_started or REG.burp_command_bot != bot.label:
+                log.debug("[BURP_LOOP] [%s] no longer active, loop exiting", bot.label)
                 return
 
-            current_time = time.time()
-            # Log current values for debugging
-            log.debug("[BURP_LOOP] Debug values: last_burp_time=%.2f, current_time=%.2f, diff=%.2f, threshold=%d+%.2f",
-                     last_burp_time, current_time, current_time - last_burp_time, BURP_COOLDOWN, current_variation)
-
-            if current_time - last_burp_time < BURP_COOLDOWN:
-                log.debug("[BURP_LOOP] Skipping due to BURP_COOLDOWN: diff=%.2f < %d",
-                         current_time - last_burp_time, BURP_COOLDOWN)
-                return
+            try:
+                current_time = _now()
+                time_diff = current_time - last_burp_time
+                threshold = CONFIG.burp_cooldown + st.variation
+                if time_diff < threshold:
+                    if _debug_on(logging.DEBUG):
+                        log.debug("[BURP_LOOP] Next /burp in %.2fs (cooldown %ds+%.2fs)",
+                                  threshold - time_diff, CONFIG.burp_cooldown, st.variation)
+                    await _sleep_or_kick(_burp_kick, threshold - time_diff)
+                    continue
 
-            # Check if enough time has passed with the current variation
-            time_diff = current_time - last_burp_time
-            threshold = BURP_COOLDOWN + current_variation
-            if last_burp_time == 0 or time_diff >= threshold:
-                log.debug("[BURP_LOOP] Condition met: last_burp_time=%s, time_diff=%.2f, threshold=%.2f",
-                         "0" if last_burp_time == 0 else "%.2f" % last_burp_time, time_diff, threshold)
+                if _debug_on(logging.DEBUG):
+                    log.debug("[BURP_LOOP] Condition met: last_burp_time=%.2f, time_diff=%.2f, threshold=%.2f",
+                             last_burp_time, time_diff, threshold)
                 # Execute the command
-                ch = await bot.fetch_channel(BURP_CH_ID)
-                cmd = discord.utils.get(await safe_fetch_commands(ch), name="burp")
+                ch = bot._burp_ch or await bot.fetch_channel(BURP_CH_ID)
+                bot._burp_ch = ch
+                guild = ch.guild
+                cmd = await cached_command(bot, ch, "burp")
                 if cmd:
                     # Log the cooldown that was used
-                    log.info("[BURP_LOOP] firing /burp in #%s with cooldown %ds+%.2fs", ch.name, BURP_COOLDOWN, current_variation)
-                    result = await safe_command_call(cmd, ch, ch.guild, client_bot=bot)
+                    log.info("[BURP_LOOP] firing /burp in #%s with cooldown %ds+%.2fs", ch.name, CONFIG.burp_cooldown, st.variation)
+                    result = await safe_command_call(cmd, ch, guild, client_bot=bot)
 
                     # Only update state if the command was actually executed (not discarded)
                     if result is not None:
@@ -915,86 +1181,112 @@ def _attach_burp_tasks(bot: commands.Bot):
                         last_burp_time = current_time
 
                         # Select a new variation for the next run
-                        current_variation = random.uniform(5.0, 30.0)  # Add 5 to 30 seconds of variation
+                        st.variation = _uniform(5.0, 30.0)  # Add 5 to 30 seconds of variation
 
                         # Rotate BURP roles after successful command execution
                         rotate_burp_roles()
                         log.info("[BURP_LOOP] Rotated BURP roles after command execution")
 
-                        burp_fails = 0
+                        st.fails = 0
                         update_hb()                                   # successful loop
-                    else:
-                        log.info("[BURP_LOOP] Command was discarded due to cooldown, not updating state")
-            else:
-                log.debug("[BURP_LOOP] Condition not met: time_diff=%.2f < threshold=%.2f, waiting...",
-                         time_diff, threshold)
-        except NET_ERR as e:
-            burp_fails += 1
-            log.warning("[BURP_LOOP] REST %r — recreate HTTP (%s/%s)", e, burp_fails, FAIL_THRESHOLD)
-            await recreate_http()
-            if burp_fails >= FAIL_THRESHOLD:
-                log.critical("[BURP_LOOP] %s fails — hard exit", FAIL_THRESHOLD)
-                os._exit(1)
+                        continue
+                    log.info("[BURP_LOOP] Command was discarded due to cooldown, not updating state")
+            except NET_ERR as e:
+                st.fails += 1
+                _cmd_cache.pop((bot.label, BURP_CH_ID, "burp"), None)
+                bot._burp_ch = None
+                if _should_recreate_http(bot):
+                    log.warning("[BURP_LOOP] REST %r — recreate HTTP (%s/%s)", e, st.fails, FAIL_THRESHOLD)
+                    await bot._recreate_http()
+                else:
+                    log.warning("[BURP_LOOP] REST %r — keeping HTTP session (%s/%s)", e, st.fails, FAIL_THRESHOLD)
+                if st.fails >= FAIL_THRESHOLD:
+                    log.critical("[BURP_LOOP] %s fails — hard exit", FAIL_THRESHOLD)
+                    _hard_exit(1)
 
-    # Store the task loop in the bot instance so it can be accessed later
-    bot._burp_loop = burp_loop
-    burp_loop.start()
+            # the firing did not go through; try again shortly
+            await _sleep(RETRY_TICK)
+
+    # Replace any loop still running on this bot, then keep the task so it can
+    # be cancelled on rotation / disconnect
+    old = getattr(bot, "_burp_loop", None)
+    if old is not None and not old.done():
+        old.cancel()
+    bot._burp_loop = asyncio.create_task(burp_loop())
 
 # ── RUNNER loop ───────────────────────────────────────────────────────────
 async def runner(token, label):
+    # One bot per label; reconnects only rebuild its HTTP session instead of the
+    # whole client and its event handlers, unless that keeps failing
+    bot = make_bot(label)
+    failures = 0                          # consecutive sessions that errored before ready
     while True:
-        bot = make_bot(label)
+        REG.bot_instances[label] = bot        # dropped again in the finally block below
+        bot._healthy = False
         try:
             await bot.login(token)
             log.info("[%s] login OK", label)
             await bot.connect(reconnect=True)
-        except (*NET_ERR, Exception) as e:
-            log.warning("[%s] error %r — restart in 5 s", label, e)
+        except NET_ERR as e:
+            # a session that got as far as on_ready was healthy: start counting anew
+            failures = 1 if bot._healthy else failures + 1
+            RUNNER_CB.record()
+            log.warning("[%s] error %r — reconnecting", label, e)
+        except Exception:
+            # a bug, not the network: surface it and let Docker restart us
+            log.exception("[%s] unexpected error — exiting", label)
+            raise
         finally:
             # Remove this bot from active bots and bot_instances
-            global active_bots, tt_command_bot, tt_scanner_bot, burp_command_bot, burp_scanner_bot, bot_instances
-
-            if label in active_bots:
-                active_bots.remove(label)
+            if label in REG.active_bots:
+                REG.active_bots.remove(label)
                 log.info("[%s] removed from active bots", label)
 
             # Remove from bot_instances dictionary
-            if label in bot_instances:
+            if label in REG.bot_instances:
                 # Stop any running task loops before removing the bot
-                bot_instance = bot_instances[label]
+                bot_instance = REG.bot_instances[label]
 
                 # Stop TT task loop if it exists and is running
-                if hasattr(bot_instance, '_tt_loop') and bot_instance._tt_loop.is_running():
+                if hasattr(bot_instance, '_tt_loop') and not bot_instance._tt_loop.done():
                     bot_instance._tt_loop.cancel()
                     log.info("[%s] TT command task loop stopped on disconnect", label)
 
                 # Stop BURP task loop if it exists and is running
-                if hasattr(bot_instance, '_burp_loop') and bot_instance._burp_loop.is_running():
+                if hasattr(bot_instance, '_burp_loop') and not bot_instance._burp_loop.done():
                     bot_instance._burp_loop.cancel()
                     log.info("[%s] BURP command task loop stopped on disconnect", label)
 
-                del bot_instances[label]
+                # the bot is reused next session: let on_ready attach its loops again
+                bot_instance._tt_started = bot_instance._burp_started = False
+
+                # Stop the forwarder; queued forwards and those still waiting out
+                # their jitter go out next session
+                if bot_instance._fwd_task and not bot_instance._fwd_task.done():
+                    bot_instance._fwd_task.cancel()
+
+                del REG.bot_instances[label]
 
                 # If this bot was assigned to any role, we need to reassign roles
                 roles_changed = False
 
-                if tt_command_bot == label:
-                    tt_command_bot = None
+                if REG.tt_command_bot == label:
+                    REG.tt_command_bot = None
                     roles_changed = True
                     log.info("[%s] was TT command bot, role now unassigned", label)
 
-                if tt_scanner_bot == label:
-                    tt_scanner_bot = None
+                if REG.tt_scanner_bot == label:
+                    REG.tt_scanner_bot = None
                     roles_changed = True
                     log.info("[%s] was TT scanner bot, role now unassigned", label)
 
-                if burp_command_bot == label:
-                    burp_command_bot = None
+                if REG.burp_command_bot == label:
+                    REG.burp_command_bot = None
                     roles_changed = True
                     log.info("[%s] was BURP command bot, role now unassigned", label)
 
-                if burp_scanner_bot == label:
-                    burp_scanner_bot = None
+                if REG.burp_scanner_bot == label:
+                    REG.burp_scanner_bot = None
                     roles_changed = True
                     log.info("[%s] was BURP scanner bot, role now unassigned", label)
 
@@ -1004,7 +1296,30 @@ async def runner(token, label):
 
             try: await bot.close()
             except Exception: pass
-            await asyncio.sleep(5)
+
+        # Only reached after a network error or a clean disconnect: a crash or a
+        # cancellation (shutdown, another runner crashing) propagates out of
+        # the finally block above without waiting out a backoff first
+
+        # cached commands hold the old session's state (or the old client)
+        _drop_cached_commands(label)
+        if failures >= FAIL_THRESHOLD:
+            # the cheap path isn't recovering: start over with a fresh client
+            log.warning("[%s] %s failed sessions in a row — rebuilding the bot", label, failures)
+            new = make_bot(label)
+            new._send_q = bot._send_q     # keep the forwards still waiting to go out
+            bot = new
+            failures = 0
+        else:
+            # Reopen the same client: reset its internal state and swap in a
+            # fresh HTTP session, since close() shut the old one down
+            bot.clear()
+            try: await bot._recreate_http(login=False)
+            except Exception as e:
+                log.warning("[%s] HTTP rebuild failed: %r", label, e)
+        delay = RUNNER_CB.backoff()
+        log.info("[%s] reconnect in %.1f s", label, delay)
+        await asyncio.sleep(delay)
 
 async def main():
     # Load the server state from file
@@ -1022,6 +1337,11 @@ async def main():
     )
 
 if __name__ == "__main__":
+    try:
+        import uvloop            # optional: libuv-backed event loop
+        uvloop.install()
+    except ImportError:
+        pass
     try:
         asyncio.run(main())
     except KeyboardInterrupt: